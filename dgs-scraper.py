@@ -5,6 +5,8 @@ and update Google Sheet with the results.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
@@ -13,6 +15,14 @@ import os
 from datetime import datetime
 import re
 
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if it isn't installed
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    print("Warning: lxml not installed - falling back to the slower html.parser")
+
 # DGS search URL with filters applied
 DGS_URL = (
     "https://www.discgolfscene.com/tournaments/search?"
@@ -33,22 +43,41 @@ DGS_URL = (
 # The actual sheet ID is different - you'll need to get it from the editable URL
 SHEET_ID = os.environ.get('GOOGLE_SHEET_ID', '1s-GhF_K0i1vACYlHBiprzpuY4cNHJnRvlwHxNaTnVWw')
 
+# Retry policy for the shared session: transient errors and 429/5xx
+# responses are retried with a doubling delay
+RETRY_ATTEMPTS = 3
+RETRY_DELAY = 2
+
+# Shared keep-alive session with the browser headers DGS expects
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(
+    total=RETRY_ATTEMPTS - 1,
+    backoff_factor=RETRY_DELAY,
+    backoff_jitter=0.25,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=['GET'],
+    raise_on_status=False,
+)))
+
+# Lowercased link/card names that are site navigation rather than tournaments
+SKIP_NAMES = frozenset(['search', 'filter', 'load more', 'view all', 'sign in', 'register'])
+
 
 def scrape_tournaments():
     """Scrape tournament data from Disc Golf Scene."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(DGS_URL, headers=headers, timeout=30)
+        response = SESSION.get(DGS_URL, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error fetching DGS: {e}")
         return []
     
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.text, HTML_PARSER)
     tournaments = []
+    seen_urls = set()
     
     # Find tournament cards/rows - DGS uses various selectors
     # Try multiple possible selectors since their HTML may change
@@ -59,48 +88,51 @@ def scrape_tournaments():
         tournament_elements = soup.select('a[href*="/tournaments/"]')
     
     for element in tournament_elements:
+        # Remove duplicates based on URL before doing any of the text extraction;
+        # elements without a tournament link are never kept either
+        url = tournament_url(element)
+        if not url or url in seen_urls:
+            continue
+        
         try:
-            tournament = parse_tournament_element(element, soup)
-            if tournament and tournament.get('name'):
-                tournaments.append(tournament)
+            tournament = parse_tournament_element(element, soup, url)
         except Exception as e:
             print(f"Error parsing tournament: {e}")
             continue
+        
+        if not tournament or not tournament.get('name'):
+            continue
+        
+        seen_urls.add(url)
+        tournaments.append(tournament)
     
-    # Remove duplicates based on URL
-    seen_urls = set()
-    unique_tournaments = []
-    for t in tournaments:
-        if t.get('url') and t['url'] not in seen_urls:
-            seen_urls.add(t['url'])
-            unique_tournaments.append(t)
+    print(f"Found {len(tournaments)} tournaments")
+    return tournaments
+
+
+def tournament_url(element):
+    """Return the absolute tournament URL for an element, or '' if it has none."""
+    if element.name == 'a':
+        href = element.get('href', '')
+    else:
+        link = element.select_one('a[href*="/tournaments/"]')
+        href = link.get('href', '') if link else ''
     
-    print(f"Found {len(unique_tournaments)} tournaments")
-    return unique_tournaments
+    if href and not href.startswith('http'):
+        href = 'https://www.discgolfscene.com' + href
+    return href
 
 
-def parse_tournament_element(element, soup):
+def parse_tournament_element(element, soup, url):
     """Parse a single tournament element and extract data."""
     tournament = {
         'date': '',
         'name': '',
         'location': '',
         'tier': '',
-        'url': ''
+        'url': url
     }
     
-    # Get tournament URL
-    if element.name == 'a':
-        href = element.get('href', '')
-    else:
-        link = element.select_one('a[href*="/tournaments/"]')
-        href = link.get('href', '') if link else ''
-    
-    if href:
-        if not href.startswith('http'):
-            href = 'https://www.discgolfscene.com' + href
-        tournament['url'] = href
-    
     # Get tournament name
     name_elem = element.select_one('.tournament-name, .event-name, h3, h4, .title')
     if name_elem:
@@ -108,9 +140,9 @@ def parse_tournament_element(element, soup):
     elif element.name == 'a':
         tournament['name'] = element.get_text(strip=True)
     
-    # Skip if it's a navigation link or empty
-    skip_names = ['search', 'filter', 'load more', 'view all', 'sign in', 'register']
-    if tournament['name'].lower() in skip_names or len(tournament['name']) < 3:
+    # Skip if it's a navigation link or empty - checked first so we don't
+    # run the remaining selectors on elements we're going to throw away
+    if tournament['name'].lower() in SKIP_NAMES or len(tournament['name']) < 3:
         return None
     
     # Get date
@@ -175,16 +207,20 @@ def update_google_sheet(tournaments):
                 t.get('url', '')
             ])
         
-        # Update sheet if we have data
+        # Data rows and the last-updated timestamp go out in a single values.batchUpdate call
+        updates = [{
+            'range': 'G1',
+            'values': [[f'Last updated: {datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")}']]
+        }]
+        if rows:
+            updates.append({'range': f'A2:E{len(rows) + 1}', 'values': rows})
+        sheet.batch_update(updates)
+        
         if rows:
-            sheet.update(f'A2:E{len(rows) + 1}', rows)
             print(f"Updated sheet with {len(rows)} tournaments")
         else:
             print("No tournaments to update")
         
-        # Update last-updated timestamp in a separate cell
-        sheet.update('G1', [[f'Last updated: {datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")}']])
-        
         return True
         
     except Exception as e:
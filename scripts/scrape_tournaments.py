@@ -5,20 +5,42 @@ Filters to tournaments within ~60 miles of Greenville, NC.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString
 import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import functools
 import re
 
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if it isn't installed
+try:
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = 'html.parser'
+    print("Warning: lxml not installed - falling back to the slower html.parser")
+
 # Google Sheet ID
 SHEET_ID = '1s-GhF_K0i1vACYlHBiprzpuY4cNHJnRvlwHxNaTnVWw'
 
 # NC Tournaments page
 DGS_NC_URL = "https://www.discgolfscene.com/tournaments/North_Carolina"
 
+# Retry policy for every request on the shared session: transient errors and
+# 429/5xx responses are retried with a doubling delay
+RETRY_ATTEMPTS = 3
+RETRY_DELAY = 2
+
+# Detail pages are fetched concurrently over the shared session; its
+# connection pool is sized to match so every worker keeps its connection
+DETAIL_WORKERS = 8
+
 # Cities within ~60 miles of Greenville, NC
 NEARBY_CITIES = [
     'greenville', 'winterville', 'ayden', 'farmville', 'grifton',
@@ -28,34 +50,183 @@ NEARBY_CITIES = [
     'robersonville', 'bethel', 'pinetops', 'hookerton', 'trenton',
 ]
 
+# Exact lookup for the common case where the listing gives a plain "City, NC"
+NEARBY_CITY_SET = frozenset(NEARBY_CITIES)
+
+# Any nearby city or a GVDG event, matched in a single scan of the lowercased text
+NEARBY_RE = re.compile('|'.join(re.escape(k) for k in NEARBY_CITIES + ['gvdg']))
+
+# Lowercased link texts on the listing page that are site navigation, not tournaments
+NAV_LINK_NAMES = frozenset(['tournaments', 'north carolina', 'register', 'results'])
+
+# Last words of two-word city names ("Rocky Mount", "New Bern", "Morehead City")
+CITY_SECOND_WORDS = frozenset(['mount', 'bern', 'hill', 'city', 'beach', 'point', 'creek'])
+
+# Month abbreviations used in "Jan 24, 2026"-style dates
+MONTH_ORDER = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+SORT_DATE_RE = re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s*(\d{4})')
+
+
+def create_session():
+    """Build the shared HTTP session, optionally backed by a local response cache."""
+    session = None
+    
+    # Set DGS_CACHE=1 while developing to reuse responses from disk for 30 minutes
+    if os.environ.get('DGS_CACHE') == '1':
+        try:
+            import requests_cache
+            session = requests_cache.CachedSession('dgs_cache', expire_after=1800)
+        except ImportError:
+            print("DGS_CACHE is set but requests-cache is not installed - fetching live")
+    
+    if session is None:
+        session = requests.Session()
+    
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    retries = Retry(
+        total=RETRY_ATTEMPTS - 1,
+        backoff_factor=RETRY_DELAY,
+        backoff_jitter=0.25,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        raise_on_status=False,
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=DETAIL_WORKERS, max_retries=retries))
+    return session
+
+
+# Shared session so the listing page and every detail page reuse the same
+# keep-alive connection to discgolfscene.com
+SESSION = create_session()
+
+# Patterns used while walking the listing page, compiled once up front
+TOURNAMENT_HREF_RE = re.compile(r'/tournaments?/[\w_]+_20\d{2}$')
+LISTING_DATE_RE = re.compile(
+    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:-\d{1,2})?\b',
+    re.IGNORECASE
+)
+LISTING_LOCATION_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*NC\b')
+LISTING_TIER_RE = re.compile(r'\b([ABCX]-tier|XC-tier|XB-tier)\b', re.IGNORECASE)
+
+# Patterns for reading a tournament's own page
+TITLE_SUFFIX_RE = re.compile(r'\s*·\s*Disc Golf Scene.*$')
+# "Sat-Sun, Jan 31-Feb 1, 2026" (spans two months)
+RANGE_DATE_RE = re.compile(
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)(?:-(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun))?,\s+'
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})-'
+    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)?\s*(\d{1,2}),\s+(\d{4})'
+)
+# "Sat, Feb 21, 2026" or "Sat-Sun, Feb 21-22, 2026" (single month)
+WEEKDAY_DATE_RE = re.compile(
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)(?:-(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun))?,\s+'
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:-\d{1,2})?,\s+(\d{4})'
+)
+# Just "Jan 31, 2026" without day of week
+PLAIN_DATE_RE = re.compile(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})')
+# "Course Name City, NC" - only tried from the start of each run of name
+# characters, so long runs of page text are scanned once instead of once per letter
+DETAIL_LOCATION_RE = re.compile(r'(?<![A-Za-z\s\'\.])[a-z\s\'\.]*+([A-Z][A-Za-z\s\'\.]++),\s*NC\b')
+
+# Tier patterns for extract_tier(), in the order they are tried
+PDGA_TIER_RE = re.compile(r'PDGA\s+([ABCX](?:/[ABCX])?-tier|XC-tier|XB-tier)', re.IGNORECASE)
+SINGLE_TIER_RE = re.compile(r'\b([ABCX]-tier)\b', re.IGNORECASE)
+X_TIER_RE = re.compile(r'\b(XC-tier|XB-tier)\b', re.IGNORECASE)
+SPACED_TIER_RE = re.compile(r'\b([ABCX])\s+tier\b', re.IGNORECASE)
+FLEX_START_RE = re.compile(r'\bFlex\s+start\b', re.IGNORECASE)
+# Text from "Flex" up to the next "·", and the tier tokens looked for inside it
+FLEX_SEGMENT_RE = re.compile(r'\bFlex[^·]*+', re.IGNORECASE)
+FLEX_TIER_RE = re.compile(r'[ABCX]-tier', re.IGNORECASE)
+SANCTIONED_RE = re.compile(r'pdga|sanctioned', re.IGNORECASE)
+ANY_TIER_RE = re.compile(r'([ABCX]-tier|XC-tier|XB-tier)', re.IGNORECASE)
+
 
 def fetch_page():
     """Fetch the DGS NC tournaments page."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     print(f"Fetching: {DGS_NC_URL}")
-    response = requests.get(DGS_NC_URL, headers=headers, timeout=30)
+    # Retries and backoff (including Retry-After on a 429) happen in the session's adapter
+    response = SESSION.get(DGS_NC_URL, timeout=30)
     response.raise_for_status()
+    
     print(f"Got {len(response.text)} bytes")
     return response.text
 
 
+def find_tournament_links(html):
+    """Yield (href, link) for each anchor pointing at a tournament detail page."""
+    if lxml_html is not None:
+        # Let libxml2 narrow the anchors down before any Python-level work
+        links = lxml_html.fromstring(html).xpath('//a[contains(@href, "/tournament")]')
+    else:
+        links = BeautifulSoup(html, HTML_PARSER).find_all('a', href=True)
+    
+    for link in links:
+        href = link.get('href', '')
+        # Must be a tournament detail page (has year suffix like _2026)
+        if TOURNAMENT_HREF_RE.search(href):
+            yield href, link
+
+
+def element_text(element):
+    """Join the stripped text nodes of an element, like get_text(strip=True)."""
+    if lxml_html is None:
+        # Link text is nearly always one text node; skip the descendant walk then
+        string = element.string
+        if type(string) is NavigableString:
+            return string.strip()
+        return element.get_text(strip=True)
+    if not isinstance(element.tag, str):
+        # Comments and processing instructions
+        return ''
+    if len(element) == 0:
+        return (element.text or '').strip()
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def link_context(link):
+    """Return the text of the nodes before and after a link within its parent."""
+    if lxml_html is None:
+        prev_text = ''
+        for sib in link.previous_siblings:
+            if hasattr(sib, 'get_text'):
+                prev_text = sib.get_text(strip=True) + ' ' + prev_text
+            elif isinstance(sib, str):
+                prev_text = sib.strip() + ' ' + prev_text
+        
+        next_text = ''
+        for sib in link.next_siblings:
+            if hasattr(sib, 'get_text'):
+                next_text += ' ' + sib.get_text(strip=True)
+            elif isinstance(sib, str):
+                next_text += ' ' + sib.strip()
+        return prev_text, next_text
+    
+    # lxml keeps text between elements on .text/.tail rather than as nodes
+    parent = link.getparent()
+    prev_parts = [(parent.text or '').strip()] if parent is not None else []
+    for sib in reversed(list(link.itersiblings(preceding=True))):
+        prev_parts.append(element_text(sib))
+        prev_parts.append((sib.tail or '').strip())
+    
+    next_parts = [(link.tail or '').strip()]
+    for sib in link.itersiblings():
+        next_parts.append(element_text(sib))
+        next_parts.append((sib.tail or '').strip())
+    
+    return ' '.join(prev_parts), ' ' + ' '.join(next_parts)
+
+
 def extract_tournaments(html):
     """Extract tournaments by finding links and their associated text."""
-    soup = BeautifulSoup(html, 'html.parser')
     tournaments = []
     seen = set()
     
     # Find all links that point to tournament pages
-    for link in soup.find_all('a', href=True):
-        href = link.get('href', '')
-        
-        # Must be a tournament detail page (has year suffix like _2026)
-        if not re.search(r'/tournaments?/[\w_]+_20\d{2}$', href):
-            continue
-        
+    for href, link in find_tournament_links(html):
         # Build full URL
         url = f"https://www.discgolfscene.com{href}" if href.startswith('/') else href
         
@@ -65,71 +236,45 @@ def extract_tournaments(html):
         seen.add(url)
         
         # The link text should be JUST the tournament name
-        name = link.get_text(strip=True)
+        name = element_text(link)
         
         # Skip if name is too short or is a navigation element
         if not name or len(name) < 5:
             continue
-        if name.lower() in ['tournaments', 'north carolina', 'register', 'results']:
+        name_lower = name.lower()
+        if name_lower in NAV_LINK_NAMES:
             continue
         
         # Now find the surrounding context to extract date and location
-        # Look at siblings and parent text
+        # Look at the link's siblings within its parent
         date_str = ''
         location = ''
         tier = ''
         
-        # Get the parent container
-        parent = link.find_parent()
-        if parent:
-            # Look at previous siblings for date info
-            prev_text = ''
-            for sib in link.previous_siblings:
-                if hasattr(sib, 'get_text'):
-                    prev_text = sib.get_text(strip=True) + ' ' + prev_text
-                elif isinstance(sib, str):
-                    prev_text = sib.strip() + ' ' + prev_text
-            
-            # Look at next siblings for location/tier info
-            next_text = ''
-            for sib in link.next_siblings:
-                if hasattr(sib, 'get_text'):
-                    next_text += ' ' + sib.get_text(strip=True)
-                elif isinstance(sib, str):
-                    next_text += ' ' + sib.strip()
-            
-            context = prev_text + ' ' + next_text
-            
-            # Extract date from context - pattern like "Jan 24" or "Feb 7-8"
-            date_match = re.search(
-                r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:-\d{1,2})?\b',
-                prev_text,
-                re.IGNORECASE
-            )
-            if date_match:
-                month = date_match.group(1)[:3].capitalize()
-                day = date_match.group(2)
-                date_str = f"{month} {day}, 2026"
-            
-            # Extract location from context - "City, NC" pattern
-            loc_match = re.search(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*NC\b', context)
-            if loc_match:
-                location = loc_match.group(1) + ', NC'
-            
-            # Extract tier
-            tier_match = re.search(r'\b([ABCX]-tier|XC-tier|XB-tier)\b', context, re.IGNORECASE)
-            if tier_match:
-                tier = tier_match.group(1)
+        prev_text, next_text = link_context(link)
+        context = prev_text + ' ' + next_text
         
-        # Check if this is a nearby tournament
-        check_text = (name + ' ' + location + ' ' + url).lower()
-        is_nearby = any(city in check_text for city in NEARBY_CITIES)
+        # Extract date from context - pattern like "Jan 24" or "Feb 7-8"
+        date_match = LISTING_DATE_RE.search(prev_text)
+        if date_match:
+            month = date_match.group(1)[:3].capitalize()
+            day = date_match.group(2)
+            date_str = f"{month} {day}, 2026"
         
-        # Also match GVDG specifically
-        if 'gvdg' in check_text:
-            is_nearby = True
+        # Extract location from context - "City, NC" pattern
+        loc_match = LISTING_LOCATION_RE.search(context)
+        if loc_match:
+            location = loc_match.group(1) + ', NC'
         
-        if is_nearby:
+        # Extract tier
+        tier_match = LISTING_TIER_RE.search(context)
+        if tier_match:
+            tier = tier_match.group(1)
+        
+        # Check if this is a nearby tournament - try the listed city first,
+        # then scan name/location/URL (which also matches GVDG specifically)
+        city_key = location.split(',', 1)[0].lower()
+        if city_key in NEARBY_CITY_SET or NEARBY_RE.search(f"{name_lower} {location.lower()} {url.lower()}"):
             tournaments.append({
                 'date': date_str,
                 'name': name,
@@ -146,147 +291,154 @@ def extract_tier(page_text):
     """Extract PDGA tier from page text using multiple patterns."""
     
     # Pattern 1: "PDGA B-tier" or "PDGA XC-tier"
-    match = re.search(r'PDGA\s+([ABCX](?:/[ABCX])?-tier|XC-tier|XB-tier)', page_text, re.IGNORECASE)
+    match = PDGA_TIER_RE.search(page_text)
     if match:
         return match.group(1)
     
     # Pattern 2: Just "B-tier" or "C-tier" standalone
-    match = re.search(r'\b([ABCX]-tier)\b', page_text, re.IGNORECASE)
+    match = SINGLE_TIER_RE.search(page_text)
     if match:
         return match.group(1)
     
     # Pattern 3: "XC-tier" or "XB-tier" standalone
-    match = re.search(r'\b(XC-tier|XB-tier)\b', page_text, re.IGNORECASE)
+    match = X_TIER_RE.search(page_text)
     if match:
         return match.group(1)
     
     # Pattern 4: Look for tier in specific HTML elements or badges
     # Sometimes it's formatted as "C tier" without hyphen
-    match = re.search(r'\b([ABCX])\s+tier\b', page_text, re.IGNORECASE)
+    match = SPACED_TIER_RE.search(page_text)
     if match:
         return f"{match.group(1)}-tier"
     
     # Pattern 5: Check for "Flex" which indicates Flex start C-tier
-    if re.search(r'\bFlex\s+start\b', page_text, re.IGNORECASE):
-        # Check if there's also a tier mentioned
-        match = re.search(r'\bFlex[^·]*([ABCX]-tier|C-tier)', page_text, re.IGNORECASE)
-        if match:
-            return match.group(1)
+    if FLEX_START_RE.search(page_text):
+        # Check if there's also a tier mentioned - the last one before the
+        # next "·", walking segments rather than backtracking over the page
+        for segment in FLEX_SEGMENT_RE.finditer(page_text):
+            tiers = FLEX_TIER_RE.findall(segment.group())
+            if tiers:
+                return tiers[-1]
     
     # Pattern 6: "PDGA-sanctioned" followed by tier somewhere
-    if 'pdga' in page_text.lower() or 'sanctioned' in page_text.lower():
-        match = re.search(r'([ABCX]-tier|XC-tier|XB-tier)', page_text, re.IGNORECASE)
+    if SANCTIONED_RE.search(page_text):
+        match = ANY_TIER_RE.search(page_text)
         if match:
             return match.group(1)
     
     return ''
 
 
+def fetch_detail_page(url):
+    """Fetch a single tournament page, returning its HTML or None."""
+    try:
+        response = SESSION.get(url, timeout=15)
+    except requests.RequestException as e:
+        print(f"    ! Error fetching {url}: {e}")
+        return None
+    if response.status_code != 200:
+        return None
+    return response.text
+
+
+def apply_tournament_details(t, html):
+    """Update a tournament with the name, date, location and tier from its page."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    page_text = soup.get_text(' ', strip=True)
+    
+    # Get title - usually in h1 or title tag
+    title_tag = soup.find('h1')
+    if title_tag:
+        clean_title = title_tag.get_text(strip=True)
+        # Remove "· Disc Golf Scene" suffix if present
+        clean_title = TITLE_SUFFIX_RE.sub('', clean_title)
+        if clean_title and len(clean_title) > 3:
+            t['name'] = clean_title
+    
+    # Get date - Try multiple patterns
+    date_str = None
+    
+    # Pattern 1: "Sat-Sun, Jan 31-Feb 1, 2026" (spans two months)
+    date_match = RANGE_DATE_RE.search(page_text)
+    if date_match:
+        date_str = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(4)}"
+    
+    # Pattern 2: "Sat, Feb 21, 2026" or "Sat-Sun, Feb 21-22, 2026" (single month)
+    if not date_str:
+        date_match = WEEKDAY_DATE_RE.search(page_text)
+        if date_match:
+            date_str = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(3)}"
+    
+    # Pattern 3: Just "Jan 31, 2026" without day of week
+    if not date_str:
+        date_match = PLAIN_DATE_RE.search(page_text)
+        if date_match:
+            date_str = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(3)}"
+    
+    if date_str:
+        t['date'] = date_str
+    
+    # Get location - look for "Course Name City, NC" pattern
+    loc_match = DETAIL_LOCATION_RE.search(page_text)
+    if loc_match:
+        loc_text = loc_match.group(1).strip()
+        # Try to extract just the city (last 1-2 words before ", NC"); the match
+        # can run back over a long stretch of page text, so only split off the tail
+        words = loc_text.rsplit(None, 2)
+        if len(words) >= 2:
+            # Check if last word is part of a two-word city
+            if words[-1].lower() in CITY_SECOND_WORDS:
+                t['location'] = ' '.join(words[-2:]) + ', NC'
+            else:
+                t['location'] = words[-1] + ', NC'
+        else:
+            t['location'] = loc_text + ', NC'
+    
+    # Get tier using improved extraction function
+    tier = extract_tier(page_text)
+    if tier:
+        t['tier'] = tier
+    
+    print(f"    → {t['name'][:40]} | {t['location']} | {t['date']} | {t['tier']}")
+
+
 def fetch_tournament_details(tournaments):
     """Fetch individual tournament pages to get accurate details."""
     print(f"\nFetching details for {len(tournaments)} tournaments...")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
-    for t in tournaments:
-        try:
-            response = requests.get(t['url'], headers=headers, timeout=15)
-            if response.status_code != 200:
+    # The page downloads overlap; parsing stays in this thread so output keeps its order
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+        pages = executor.map(fetch_detail_page, [t['url'] for t in tournaments])
+        for t, html in zip(tournaments, pages):
+            if html is None:
                 continue
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            page_text = soup.get_text(' ', strip=True)
-            
-            # Get title - usually in h1 or title tag
-            title_tag = soup.find('h1')
-            if title_tag:
-                clean_title = title_tag.get_text(strip=True)
-                # Remove "· Disc Golf Scene" suffix if present
-                clean_title = re.sub(r'\s*·\s*Disc Golf Scene.*$', '', clean_title)
-                if clean_title and len(clean_title) > 3:
-                    t['name'] = clean_title
-            
-            # Get date - Try multiple patterns
-            date_str = None
-            
-            # Pattern 1: "Sat-Sun, Jan 31-Feb 1, 2026" (spans two months)
-            date_match = re.search(
-                r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)(?:-(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun))?,\s+'
-                r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})-'
-                r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)?\s*(\d{1,2}),\s+(\d{4})',
-                page_text
-            )
-            if date_match:
-                date_str = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(4)}"
-            
-            # Pattern 2: "Sat, Feb 21, 2026" or "Sat-Sun, Feb 21-22, 2026" (single month)
-            if not date_str:
-                date_match = re.search(
-                    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)(?:-(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun))?,\s+'
-                    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:-\d{1,2})?,\s+(\d{4})',
-                    page_text
-                )
-                if date_match:
-                    date_str = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(3)}"
-            
-            # Pattern 3: Just "Jan 31, 2026" without day of week
-            if not date_str:
-                date_match = re.search(
-                    r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})',
-                    page_text
-                )
-                if date_match:
-                    date_str = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(3)}"
-            
-            if date_str:
-                t['date'] = date_str
-            
-            # Get location - look for "Course Name City, NC" pattern
-            loc_match = re.search(r'([A-Z][A-Za-z\s\'\.]+),\s*NC\b', page_text)
-            if loc_match:
-                loc_text = loc_match.group(1).strip()
-                # Try to extract just the city (last 1-2 words before ", NC")
-                words = loc_text.split()
-                if len(words) >= 2:
-                    # Check if last word is part of a two-word city
-                    if words[-1].lower() in ['mount', 'bern', 'hill', 'city', 'beach', 'point', 'creek']:
-                        t['location'] = ' '.join(words[-2:]) + ', NC'
-                    else:
-                        t['location'] = words[-1] + ', NC'
-                else:
-                    t['location'] = loc_text + ', NC'
-            
-            # Get tier using improved extraction function
-            tier = extract_tier(page_text)
-            if tier:
-                t['tier'] = tier
-            
-            print(f"    → {t['name'][:40]} | {t['location']} | {t['date']} | {t['tier']}")
-            
-        except Exception as e:
-            print(f"    ! Error fetching {t['url']}: {e}")
-            continue
+            try:
+                apply_tournament_details(t, html)
+            except Exception as e:
+                print(f"    ! Error parsing {t['url']}: {e}")
     
     return tournaments
 
 
-def sort_by_date(tournaments):
-    """Sort tournaments by date."""
-    month_order = {
-        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-    }
-    
-    def get_sort_key(t):
-        date_str = t.get('date', '')
-        match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s*(\d{4})', date_str)
-        if match:
-            return (int(match.group(3)), month_order.get(match.group(1), 0), int(match.group(2)))
-        return (9999, 99, 99)
+@functools.lru_cache(maxsize=512)
+def date_sort_key(date_str):
+    """Turn a "Jan 24, 2026" date into a (year, month, day) tuple; undated sorts last."""
+    # Fast path for the exact format the extractors build
+    month, _, rest = date_str.partition(' ')
+    day, _, year = rest.partition(', ')
+    if month in MONTH_ORDER and day.isdigit() and len(day) <= 2 and year.isdigit() and len(year) == 4:
+        return (int(year), MONTH_ORDER[month], int(day))
     
-    return sorted(tournaments, key=get_sort_key)
+    match = SORT_DATE_RE.search(date_str)
+    if match:
+        return (int(match.group(3)), MONTH_ORDER.get(match.group(1), 0), int(match.group(2)))
+    return (9999, 99, 99)
+
+
+def sort_by_date(tournaments):
+    """Sort tournaments by date, in place; the same list is returned."""
+    tournaments.sort(key=lambda t: date_sort_key(t.get('date', '')))
+    return tournaments
 
 
 def update_google_sheet(tournaments):
@@ -319,26 +471,25 @@ def update_google_sheet(tournaments):
         print("Clearing sheet...")
         sheet.clear()
         
-        # Write header row
+        # Header, data rows and timestamp go out in a single values.batchUpdate call
         headers = ['Date', 'Name', 'Location', 'Tier', 'URL']
-        sheet.update('A1:E1', [headers])
+        rows = [[
+            t.get('date', ''),
+            t.get('name', ''),
+            t.get('location', ''),
+            t.get('tier', ''),
+            t.get('url', '')
+        ] for t in tournaments]
+        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
         
-        # Write data
-        if tournaments:
-            rows = [[
-                t.get('date', ''),
-                t.get('name', ''),
-                t.get('location', ''),
-                t.get('tier', ''),
-                t.get('url', '')
-            ] for t in tournaments]
-            
+        updates = [
+            {'range': 'A1:E1', 'values': [headers]},
+            {'range': 'G1', 'values': [[f'Updated: {timestamp}']]},
+        ]
+        if rows:
             print(f"Writing {len(rows)} rows...")
-            sheet.update(f'A2:E{len(rows) + 1}', rows)
-        
-        # Timestamp
-        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-        sheet.update('G1', [[f'Updated: {timestamp}']])
+            updates.append({'range': f'A2:E{len(rows) + 1}', 'values': rows})
+        sheet.batch_update(updates)
         
         print(f"✓ Done at {timestamp}")
         return True